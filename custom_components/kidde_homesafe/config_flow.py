@@ -41,7 +41,7 @@ class ConfigFlow(ConfigFlow, domain=DOMAIN):
             except KiddeClientAuthError:
                 errors["base"] = "invalid_auth"
             except Exception as e:
-                _LOGGER.exception(f"{type(e).__name__}: {e}")
+                _LOGGER.exception("%s: %s", type(e).__name__, e)
                 errors["base"] = "unknown"
             else:
                 update_interval = user_input["update_interval_seconds"]
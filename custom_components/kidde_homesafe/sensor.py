@@ -50,23 +50,38 @@ MB_MODELS_DETECT_SERIES: Final = {48, 46}
 # Keys to skip for DETECT models (they return 0 or unhelpful data)
 _SKIP_SIMPLE_SENSOR_KEYS: Final = {"batt_volt", "battery_voltage"}
 
-# Unit/Name configuration for the 'life' sensor based on mb_model
-LIFE_SENSOR_CONFIG: Final[dict] = {
-    48: { # MB Model 48 (DETECT Smoke/CO)
-        "name": "Days to replace",
-        "unit": UnitOfTime.DAYS,
-    },
-    46: { # MB Model 46 (DETECT Smoke Only)
-        "name": "Days to replace",
-        "unit": UnitOfTime.DAYS,
-    },
-    "default": {
-        "name": "Weeks to replace", # Default for older/non-DETECT models
-        "unit": UnitOfTime.WEEKS,
-    },
+# Name/Unit variants of the 'life' sensor, selected by mb_model
+_LIFE_DESC_DAYS: Final = SensorEntityDescription(
+    key=LIFE_SENSOR_KEY,
+    icon="mdi:calendar-clock",
+    name="Days to replace",
+    state_class=SensorStateClass.MEASUREMENT,
+    native_unit_of_measurement=UnitOfTime.DAYS,
+)
+_LIFE_DESC_WEEKS: Final = SensorEntityDescription(
+    key=LIFE_SENSOR_KEY,
+    icon="mdi:calendar-clock",
+    name="Weeks to replace",  # Default for older/non-DETECT models
+    state_class=SensorStateClass.MEASUREMENT,
+    native_unit_of_measurement=UnitOfTime.WEEKS,
+)
+_LIFE_DESC_BY_MB: Final[dict[int, SensorEntityDescription]] = {
+    48: _LIFE_DESC_DAYS,  # MB Model 48 (DETECT Smoke/CO)
+    46: _LIFE_DESC_DAYS,  # MB Model 46 (DETECT Smoke Only)
 }
 # ---------------------------------
 
+# Kidde measurement unit (upper-cased) to Home Assistant unit
+_UNIT_MAP: Final[dict[str, str]] = {
+    "C": UnitOfTemperature.CELSIUS,
+    "F": UnitOfTemperature.FAHRENHEIT,
+    "%RH": PERCENTAGE,
+    "HPA": UnitOfPressure.PA,
+    "PPB": CONCENTRATION_PARTS_PER_BILLION,
+    "PPM": CONCENTRATION_PARTS_PER_MILLION,
+    "V": UnitOfElectricPotential.VOLT,
+}
+
 
 _TIMESTAMP_DESCRIPTIONS = (
     SensorEntityDescription(
@@ -129,14 +144,6 @@ _SENSOR_DESCRIPTIONS = (
         native_unit_of_measurement=UnitOfElectricPotential.VOLT,
         suggested_display_precision=2,
     ),
-    # NOTE: This is the description for the custom KiddeSensorLifeEntity
-    SensorEntityDescription(
-        key=LIFE_SENSOR_KEY,
-        icon="mdi:calendar-clock",
-        name="Weeks to replace",
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfTime.WEEKS,
-    ),
     SensorEntityDescription(
         key="ap_rssi",
         icon="mdi:wifi-strength-3",
@@ -259,6 +266,34 @@ _SENSOR_MEASUREMENT_DESCRIPTIONS = (
 )
 
 
+def _parse_timestamp(value: str) -> datetime.datetime:
+    """Parse a Kidde "YYYY-MM-DDTHH:MM:SS[.ffffff][Z]" timestamp as UTC."""
+    if (
+        value[4:5] == "-"
+        and value[7:8] == "-"
+        and value[10:11] == "T"
+        and value[13:14] == ":"
+        and value[16:17] == ":"
+        and value[19:20] in ("", ".", "Z")
+    ):
+        # Zero-padded form: slice the fields directly instead of strptime.
+        return datetime.datetime(
+            int(value[0:4]),
+            int(value[5:7]),
+            int(value[8:10]),
+            int(value[11:13]),
+            int(value[14:16]),
+            int(value[17:19]),
+            tzinfo=datetime.UTC,
+        )
+    # Anything else (e.g. unpadded fields) goes through the strict parser,
+    # which rejects offsets and other separators.
+    stripped = value.strip("Z").split(".")[0]
+    return datetime.datetime.strptime(stripped, "%Y-%m-%dT%H:%M:%S").replace(
+        tzinfo=datetime.UTC
+    )
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_devices: AddEntitiesCallback
 ) -> None:
@@ -266,66 +301,24 @@ async def async_setup_entry(
     coordinator: KiddeCoordinator = hass.data[DOMAIN][entry.entry_id]
     sensors: list[SensorEntity] = []
 
-    # --- Find the entity description for 'life' once ---
-    life_description = next(
-        (
-            desc for desc in _SENSOR_DESCRIPTIONS 
-            if desc.key == LIFE_SENSOR_KEY
-        ),
-        None,
-    )
-
     for device_id, device_data in coordinator.data.devices.items():
         mb_model = device_data.get(KEY_MB_MODEL)
-        if logger.isEnabledFor(logging.DEBUG):
-            logger.debug(
-                "Checking model: [%s] (MB:%s)",
-                coordinator.data.devices[device_id].get(KEY_MODEL, "Unknown"),
-                mb_model,
-            )
-
-        for entity_description in _TIMESTAMP_DESCRIPTIONS:
-            if entity_description.key in device_data:
-                sensors.append(
-                    KiddeSensorTimestampEntity(
-                        coordinator, device_id, entity_description
-                    )
-                )
-
-        # -------------------------------------------------------------
-        # 1. Custom Life Sensor Entity
-        if LIFE_SENSOR_KEY in device_data and life_description:
-            sensors.append(
-                KiddeSensorLifeEntity(coordinator, device_id, life_description)
-            )
-        # -------------------------------------------------------------
-
-        for entity_description in _SENSOR_DESCRIPTIONS:
-            # Skip the 'life' sensor from the simple loop, as it's handled by the custom entity
-            if entity_description.key == LIFE_SENSOR_KEY:
-                continue
-
-            # --- DETECT Series Check for Voltage Sensor Exclusion ---
-            if (
-                entity_description.key in _SKIP_SIMPLE_SENSOR_KEYS and 
-                mb_model in MB_MODELS_DETECT_SERIES
-            ):
-                logger.debug(f"Skipping sensor '{entity_description.key}' because mb_model {mb_model} is DETECT series.")
-                continue
-            # --- END Check ---
-
-            if entity_description.key in device_data:
-                sensors.append(
-                    KiddeSensorEntity(coordinator, device_id, entity_description)
-                )
-
-        for entity_description in _SENSOR_MEASUREMENT_DESCRIPTIONS:
-            if entity_description.key in device_data:
-                sensors.append(
-                    KiddeSensorMeasurementEntity(
-                        coordinator, device_id, entity_description
-                    )
-                )
+        logger.debug(
+            "Checking model: [%s] (MB:%s)",
+            device_data.get(KEY_MODEL, "Unknown"),
+            mb_model,
+        )
+
+        # Only create the sensors whose key this device actually reports,
+        # leaving out the voltage sensors DETECT models report unhelpfully
+        hits = device_data.keys() & (
+            _DETECT_KEYS if mb_model in MB_MODELS_DETECT_SERIES else _ALL_KEYS
+        )
+        sensors.extend(
+            entity_class(coordinator, device_id, entity_description)
+            for entity_description, entity_class in _SENSOR_ENTITIES
+            if entity_description.key in hits
+        )
 
     async_add_devices(sensors)
 
@@ -333,26 +326,23 @@ async def async_setup_entry(
 class KiddeSensorTimestampEntity(KiddeEntity, SensorEntity):
     """A KiddeSensoryEntity which returns a datetime."""
 
+    __slots__ = ()
+
     @property
     def native_value(self) -> datetime.datetime | None:
         """Return the native value of the sensor."""
         value = self.kidde_device.get(self.entity_description.key)
-        dtype = type(value)
-        if logger.isEnabledFor(logging.DEBUG):
-            logger.debug(
-                "%s, of type %s is %s",
-                self.entity_description.key,
-                dtype,
-                value,
-            )
+        logger.debug(
+            "%s, of type %s is %s",
+            self.entity_description.key,
+            type(value),
+            value,
+        )
         if value is None:
             return value
-        stripped = value.strip("Z").split(".")[0]
         try:
-            return datetime.datetime.strptime(stripped, "%Y-%m-%dT%H:%M:%S").replace(
-                tzinfo=datetime.UTC
-            )
-        except ValueError as e:
+            return _parse_timestamp(value)
+        except (ValueError, TypeError, AttributeError) as e:
             if logger.isEnabledFor(logging.DEBUG):
                 logger.error("Error parsing datetime '%s': %s", value, e)
             return None
@@ -360,9 +350,11 @@ class KiddeSensorTimestampEntity(KiddeEntity, SensorEntity):
 
 class KiddeSensorLifeEntity(KiddeEntity, SensorEntity):
     """Custom entity for the 'life' sensor to conditionally adjust units."""
-    
-    # FIX: Remove the conflicting @property definition and move the dynamic logic 
-    # to the __init__ to set the attributes directly.
+
+    __slots__ = ()
+
+    # FIX: Remove the conflicting @property definition and move the dynamic logic
+    # to the __init__ to set the description directly.
     def __init__(
         self,
         coordinator: KiddeCoordinator,
@@ -370,30 +362,14 @@ class KiddeSensorLifeEntity(KiddeEntity, SensorEntity):
         entity_description: SensorEntityDescription,
     ) -> None:
         """Initialize the custom life sensor."""
-        
-        # 1. Call the base class __init__ FIRST. This successfully sets 
-        #    self.entity_description = entity_description (the base one).
         super().__init__(coordinator, device_id, entity_description)
 
-        # 2. Get the model-specific configuration (Name and Unit).
-        config = self._model_config
-        
-        # 3. Dynamically override the entity's Name and Unit attributes 
-        #    using the Home Assistant standard pattern.
-        #    We must override _attr_name and _attr_native_unit_of_measurement
-        self._attr_native_unit_of_measurement = config["unit"]
-        self._attr_name = config["name"]
-
+        # Swap in the model-specific description (Name and Unit), shared
+        # between every life sensor on the same mb_model.
+        self.entity_description = _LIFE_DESC_BY_MB.get(
+            self.kidde_device.get(KEY_MB_MODEL), entity_description
+        )
 
-    @property
-    def _model_config(self) -> dict:
-        """Get the specific config (name/unit) based on the device mb_model."""
-        
-        # Use the mb_model (integer) for the lookup, falling back to "default" if not found
-        device_identifier = self.kidde_device.get(KEY_MB_MODEL, "default")
-        
-        return LIFE_SENSOR_CONFIG.get(device_identifier, LIFE_SENSOR_CONFIG["default"])
-        
     @property
     def native_value(self) -> float | None:
         """Return the native value of the sensor."""
@@ -403,102 +379,93 @@ class KiddeSensorLifeEntity(KiddeEntity, SensorEntity):
 class KiddeSensorEntity(KiddeEntity, SensorEntity):
     """Sensor for Kidde HomeSafe."""
 
+    __slots__ = ()
+
     @property
     def native_value(self) -> str | None | float | int:
         """Return the native value of the sensor."""
         value = self.kidde_device.get(self.entity_description.key)
-        dtype = type(value)
-        if logger.isEnabledFor(logging.DEBUG):
-            logger.debug(
-                "%s, of type %s is %s",
-                self.entity_description.key,
-                dtype,
-                value,
-            )
+        logger.debug(
+            "%s, of type %s is %s",
+            self.entity_description.key,
+            type(value),
+            value,
+        )
         return value
 
 
 class KiddeSensorMeasurementEntity(KiddeEntity, SensorEntity):
     """Measurement Sensor for Kidde HomeSafe."""
 
+    __slots__ = ()
+
     @property
     def state_class(self) -> str:
         """Return the state class of sensor."""
         return SensorStateClass.MEASUREMENT
 
+    def _entity_dict(self, expected: str) -> dict | None:
+        """Return the sensor's entity dict, or None if the device has none."""
+        entity_dict = self.kidde_device.get(self.entity_description.key)
+        if isinstance(entity_dict, dict):
+            return entity_dict
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.warning(
+                "Unexpected type [%s], expected %s dict for [%s]",
+                type(entity_dict),
+                expected,
+                self.entity_description.key,
+            )
+        return None
+
     @property
     def native_value(self) -> float | None:
         """Return the native value of the sensor."""
-        entity_dict = self.kidde_device.get(self.entity_description.key)
-        if isinstance(entity_dict, dict):
-            sensor_value = entity_dict.get(KEY_VALUE)
-        else:
-            ktype = type(entity_dict)
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.warning(
-                    "Unexpected type [%s], expected entity dict for [%s]",
-                    ktype,
-                    self.entity_description.key,
-                )
-            sensor_value = None
-        return sensor_value
+        entity_dict = self._entity_dict("entity")
+        return None if entity_dict is None else entity_dict.get(KEY_VALUE)
 
     @property
     def native_unit_of_measurement(self) -> str | None:
         """Return the native unit of measurement of the sensor."""
-        entity_dict = self.kidde_device.get(self.entity_description.key)
+        entity_dict = self._entity_dict("entity")
+        if entity_dict is None:
+            return None
 
-        if not isinstance(entity_dict, dict):
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.warning(
-                    "Unexpected type [%s], expected entity dict for [%s]",
-                    type(entity_dict),
-                    self.entity_description.key,
-                )
+        entity_unit = entity_dict.get(KEY_UNIT)
+        if not entity_unit:
             return None
 
-        entity_unit = entity_dict.get(KEY_UNIT, "").upper()
-
-        match entity_unit:
-            case "C":
-                return UnitOfTemperature.CELSIUS
-            case "F":
-                return UnitOfTemperature.FAHRENHEIT
-            case "%RH":
-                return PERCENTAGE
-            case "HPA":
-                return UnitOfPressure.PA
-            case "PPB":
-                return CONCENTRATION_PARTS_PER_BILLION
-            case "PPM":
-                return CONCENTRATION_PARTS_PER_MILLION
-            case "V":
-                return UnitOfElectricPotential.VOLT
-            case _:
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.warning(
-                        "Unknown unit [%s] for sensor [%s]",
-                        entity_unit,
-                        self.entity_description.key,
-                    )
-                return None
+        unit = _UNIT_MAP.get(entity_unit.upper())
+        if unit is None and logger.isEnabledFor(logging.DEBUG):
+            logger.warning(
+                "Unknown unit [%s] for sensor [%s]",
+                entity_unit,
+                self.entity_description.key,
+            )
+        return unit
 
     @property
     def extra_state_attributes(self) -> dict:
         """Return additional attributes for the value sensor (Status)."""
-        entity_dict = self.kidde_device.get(self.entity_description.key)
-        attribute_dict = None
-        if isinstance(entity_dict, dict):
-            attribute_dict = {"Status": entity_dict.get(KEY_STATUS)}
-        else:
-            ktype = type(entity_dict)
-            if logger.isEnabledFor(logging.DEBUG):
-                # FIX: Corrected a missing closing parenthesis, which was not the current issue, 
-                # but might be a future error point.
-                logger.warning(
-                    "Unexpected type [%s], expected state attributes dict for [%s]",
-                    ktype,
-                    self.entity_description.key,
-                )
-            attribute_dict = {"Status": None}
-        return attribute_dict
+        entity_dict = self._entity_dict("state attributes")
+        if entity_dict is None:
+            return {"Status": None}
+        return {"Status": entity_dict.get(KEY_STATUS)}
+
+
+# Every sensor description with the entity class that implements it, in the
+# order entities are created (this decides which duplicate name gets "_2")
+_SENSOR_ENTITIES: Final[
+    tuple[tuple[SensorEntityDescription, type[KiddeEntity]], ...]
+] = (
+    *((desc, KiddeSensorTimestampEntity) for desc in _TIMESTAMP_DESCRIPTIONS),
+    # The 'life' sensor is handled by the custom KiddeSensorLifeEntity
+    (_LIFE_DESC_WEEKS, KiddeSensorLifeEntity),
+    *((desc, KiddeSensorEntity) for desc in _SENSOR_DESCRIPTIONS),
+    *(
+        (desc, KiddeSensorMeasurementEntity)
+        for desc in _SENSOR_MEASUREMENT_DESCRIPTIONS
+    ),
+)
+_ALL_KEYS: Final = frozenset(desc.key for desc, _ in _SENSOR_ENTITIES)
+_DETECT_KEYS: Final = _ALL_KEYS - _SKIP_SIMPLE_SENSOR_KEYS